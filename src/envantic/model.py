@@ -1,8 +1,11 @@
+import functools
 import os
+import sys
 from pathlib import Path
 from typing import (
     IO,
     Any,
+    Callable,
     ClassVar,
     Self,
     Type,
@@ -17,9 +20,18 @@ from pydantic import BaseModel, TypeAdapter
 
 _truthy = {"1", "true", "yes", "on", "y", "t"}
 _falsy = {"0", "false", "no", "off", "n", "f"}
+_bool_literals = dict.fromkeys(_truthy, True) | dict.fromkeys(_falsy, False)
+# First non-whitespace characters a JSON document can start with
+_json_start = frozenset('{["-0123456789tfnNI')
 
 T = TypeVar("T")
 
+# The process environment; os.environb shares its data on POSIX
+_process_environ = os.environ
+
+# (field name, env var name, encoded env var name, caster) per field
+_EnvPlan = tuple[tuple[str, str, bytes, Callable[[str], object]], ...]
+
 
 class EnvModel(BaseModel):
     """
@@ -35,10 +47,20 @@ class EnvModel(BaseModel):
     - Otherwise, apply pragmatic fallbacks: truthy/falsey for bool, CSV for lists/sets,
       "k=v,k=v" for dicts, and tuple CSV mapping
     - Finally, defer to `validate_python` for types like Enum/Path/date-time
+
+    The env var names and casters are computed on first use and cached per class;
+    they are recomputed if `__env_prefix__` is reassigned later on.
+
+    Set `__env_skip_validation__ = True` to build instances with `model_construct()`
+    instead of full validation. Casters then must produce correctly typed values,
+    and overrides are trusted as-is.
     """
 
     __env_prefix__: ClassVar[str] = ""  # Optional: e.g. "APP_"
     __env_registry__: ClassVar[set[Type[Self]]] = set()
+    __env_skip_validation__: ClassVar[bool] = False  # Use model_construct()
+    # (__env_prefix__ it was built for, plan), cached by `_get_env_plan()`
+    __env_plan__: ClassVar["tuple[str, _EnvPlan] | None"] = None
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         """Automatically register subclass to registry when created"""
@@ -50,33 +72,24 @@ class EnvModel(BaseModel):
     @classmethod
     def from_env(cls, **overrides: object) -> Self:
         vals: dict[str, object] = {}
+        plan = _get_env_plan(cls)
+        # Snapshot just the plan's env vars (one lookup per field, not a copy of
+        # the whole environment) so every field resolves against the same view
+        get_env = _read_env(plan).get
 
-        fields = cls.model_fields
-        for name, finfo in fields.items():
+        for name, env_key, _, caster in plan:
             # 1) explicit overrides take precedence
             if name in overrides:
                 vals[name] = overrides[name]
-                continue
-
-            # 2) decide env var key (Field.json_schema_extra["env"] can override)
-            env_name = name
-            extra = finfo.json_schema_extra
-            if isinstance(extra, dict):
-                prefix: bool = bool(extra.get("prefix", True))  # pyright: ignore[reportUnknownArgumentType, reportUnknownMemberType]
-                custom = extra.get("env")  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
-                if isinstance(custom, str) and custom:
-                    env_name = custom
-            else:
-                prefix = True
-
-            env_key = ((cls.__env_prefix__ if prefix else "") + env_name).upper()
-            if env_key in os.environ:
-                ann = finfo.annotation or str
-                vals[name] = _cast(os.environ[env_key], ann)
-
-        # Remaining fields are handled by Pydantic defaults/validation
-        known_overrides = {k: v for k, v in overrides.items() if k in fields}
-        return cls(**(vals | known_overrides))
+            # 2) matching environment variable, cast to the field type
+            elif (value := get_env(env_key)) is not None:
+                vals[name] = caster(value)
+
+        # Only overridden or env-provided fields are passed on; remaining fields
+        # keep their defaults without being parsed (unknown overrides are ignored)
+        if cls.__env_skip_validation__:
+            return cls.model_construct(None, **vals)
+        return cls(**vals)
 
     @classmethod
     def from_dotenv(
@@ -122,24 +135,91 @@ class EnvModel(BaseModel):
         return cls.from_env(**overrides)
 
 
+# Reverse index for get_registered_envs(), stored with the registry state it covers
+_registered_envs_cache: (
+    tuple[
+        tuple[tuple[Type[EnvModel], _EnvPlan], ...],
+        dict[str, set[tuple[Type[EnvModel], str]]],
+    ]
+    | None
+) = None
+
+
 def get_registered_models() -> dict[Type[EnvModel], dict[str, str]]:
     return {
         model_cls: {
-            field_name: _get_env_var_name(model_cls, field_name, finfo)
-            for field_name, finfo in model_cls.model_fields.items()
+            field_name: env_var_name
+            for field_name, env_var_name, _, _ in _get_env_plan(model_cls)
         }
         for model_cls in list(EnvModel.__env_registry__)
     }
 
 
 def get_registered_envs() -> dict[str, set[tuple[Type[EnvModel], str]]]:
-    env_var_map: dict[str, set[tuple[Type[EnvModel], str]]] = {}
-    for model_cls, info in get_registered_models().items():
-        for field_name, env_var_name in info.items():
-            if env_var_name not in env_var_map:
-                env_var_map[env_var_name] = set()
-            env_var_map[env_var_name].add((model_cls, field_name))
-    return env_var_map
+    global _registered_envs_cache
+    # Key the cached index on the registry contents and each model's current plan,
+    # so registry edits and `__env_prefix__` changes are always picked up
+    key = tuple(
+        (model_cls, _get_env_plan(model_cls))
+        for model_cls in list(EnvModel.__env_registry__)
+    )
+    if _registered_envs_cache is None or _registered_envs_cache[0] != key:
+        env_var_map: dict[str, set[tuple[Type[EnvModel], str]]] = {}
+        for model_cls, plan in key:
+            for field_name, env_var_name, _, _ in plan:
+                if env_var_name not in env_var_map:
+                    env_var_map[env_var_name] = set()
+                env_var_map[env_var_name].add((model_cls, field_name))
+        _registered_envs_cache = (key, env_var_map)
+    # Hand out copies so callers cannot mutate the cached index
+    return {k: set(v) for k, v in _registered_envs_cache[1].items()}
+
+
+def _get_env_plan(cls: Type[EnvModel]) -> _EnvPlan:
+    """
+    Return the (field name, env var name, encoded name, caster) plan for `cls`.
+    The plan is cached on the class once Pydantic has completed it (forward refs
+    resolved, e.g. after `model_rebuild()`), and rebuilt if `__env_prefix__` changes.
+    """
+    cached = cls.__dict__.get("__env_plan__")
+    if cached is not None and cached[0] == cls.__env_prefix__:
+        return cached[1]
+
+    plan: list[tuple[str, str, bytes, Callable[[str], object]]] = []
+    for field_name, finfo in cls.model_fields.items():
+        env_var_name = sys.intern(_get_env_var_name(cls, field_name, finfo))
+        plan.append(
+            (
+                sys.intern(field_name),
+                env_var_name,
+                os.fsencode(env_var_name),
+                _make_caster(finfo.annotation or str),
+            )
+        )
+    entries = tuple(plan)
+    # Incomplete models may still hold unresolved annotations: don't cache those
+    if cls.__pydantic_complete__:
+        cls.__env_plan__ = (cls.__env_prefix__, entries)
+    return entries
+
+
+def _read_env(plan: _EnvPlan) -> dict[str, str]:
+    """Snapshot the values of the plan's env vars that are currently set."""
+    if os.supports_bytes_environ and os.environ is _process_environ:
+        # Look up the raw bytes names and decode only the values that are set
+        get_environb = os.environb.get
+        return {
+            env_key: os.fsdecode(value)
+            for _, env_key, env_key_b, _ in plan
+            if (value := get_environb(env_key_b)) is not None
+        }
+    # Windows, or os.environ replaced (e.g. mock.patch("os.environ", {...}))
+    get_environ = os.environ.get
+    return {
+        env_key: value
+        for _, env_key, _, _ in plan
+        if (value := get_environ(env_key)) is not None
+    }
 
 
 def _strip_optional(tp: type) -> tuple[type, bool]:
@@ -152,86 +232,199 @@ def _strip_optional(tp: type) -> tuple[type, bool]:
     return tp, False
 
 
-def _try_typeadapter_json(value: str, tp: Type[T]) -> T:
-    """Attempt JSON parsing via TypeAdapter first."""
-    adapter = TypeAdapter(tp)
-    return adapter.validate_json(value)
+def _json_validator(tp: Type[T]) -> Callable[[str], T]:
+    """Return a JSON validator for `tp`; the TypeAdapter is built on first use."""
+    if isinstance(tp, type) and issubclass(tp, BaseModel):
+        model = tp
+
+        # Nested models already carry a compiled validator; no TypeAdapter needed.
+        # Look it up per call so a nested model rebuilt later is picked up.
+        def validate_model(value: str) -> T:
+            return model.__pydantic_validator__.validate_json(value)
+
+        return validate_model
+
+    adapter: TypeAdapter[T] | None = None
+
+    def validate(value: str) -> T:
+        nonlocal adapter
+        if adapter is None:
+            adapter = TypeAdapter(tp)
+        return adapter.validate_json(value)
+
+    return validate
+
+
+def _python_validator(tp: Type[T]) -> Callable[[Any], T]:
+    """Return a Python validator for `tp` (e.g., str -> target type)."""
+    adapter: TypeAdapter[T] | None = None
+
+    def validate(value: Any) -> T:
+        nonlocal adapter
+        if adapter is None:
+            adapter = TypeAdapter(tp)
+        return adapter.validate_python(value)
+
+    return validate
+
+
+def _parse_bool(value: str) -> bool:
+    v = value.strip().lower()
+    parsed = _bool_literals.get(v)
+    if parsed is not None:
+        return parsed
+    # Numeric and other strings: best-effort handling
+    return bool(int(v)) if v.isdigit() else bool(v)
+
+
+def _make_caster(tp: Type[T]) -> Callable[[str], object]:
+    """Return the caster for `tp`, shared by every field with the same annotation."""
+    try:
+        hash(tp)
+    except TypeError:
+        return _build_caster(tp)
+    return _cached_caster(tp)
 
 
-def _try_typeadapter_python(value: Any, tp: Type[T]) -> T:
-    """Validate as Python value via TypeAdapter (e.g., str -> target type)."""
-    adapter = TypeAdapter(tp)
-    return adapter.validate_python(value)
+@functools.lru_cache(maxsize=None)
+def _cached_caster(tp: type) -> Callable[[str], object]:
+    return _build_caster(tp)
 
 
-def _cast(value: str, tp: Type[T]) -> object:
+def _build_caster(tp: Type[T]) -> Callable[[str], object]:
     """
-    Cast an environment string to the annotated field type.
+    Build a caster turning an environment string into the annotated field type.
     1) Prefer JSON via TypeAdapter
     2) If not JSON, apply idiomatic fallbacks (bool/int/float/CSV/dict k=v, etc.)
     3) Finally, delegate to TypeAdapter.validate_python
     """
     tp_no_optional, _ = _strip_optional(tp)
-    origin = get_origin(tp_no_optional)
-
-    # 1) Prefer JSON for nested models/collections/Enum/datetime, etc.
-    try:
-        return _try_typeadapter_json(value, tp_no_optional)  # pyright: ignore[reportUnknownVariableType]
-    except Exception:
-        pass
+    from_json = _json_validator(tp_no_optional)
+    fallback = _make_fallback(tp_no_optional)
+    is_bool = tp_no_optional is bool
+
+    def cast(value: str) -> object:
+        # 0) Exact bool literals ("true", "0", "on", ...) need neither JSON nor lower()
+        if is_bool:
+            parsed = _bool_literals.get(value)
+            if parsed is not None:
+                return parsed
+
+        # 1) Prefer JSON for nested models/collections/Enum/datetime, etc.
+        #    Skip the attempt (and its ValidationError) when it cannot be JSON
+        head = value.lstrip()[:1]
+        if head in _json_start:
+            try:
+                return from_json(value)
+            except Exception:
+                pass
+        return fallback(value)
+
+    return cast
+
+
+def _make_fallback(tp: type) -> Callable[[str], object]:
+    """Pick the idiomatic fallback for non-JSON plain strings."""
+    origin = get_origin(tp)
 
-    # 2) Idiomatic fallbacks for non-JSON plain strings
     # 2-1) bool
-    if tp_no_optional is bool:
-        v = value.strip().lower()
-        if v in _truthy:
-            return True
-        if v in _falsy:
-            return False
-        # Numeric and other strings: best-effort handling
-        return bool(int(v)) if v.isdigit() else bool(v)
+    if tp is bool:
+        return _parse_bool
 
     # 2-2) Scalars
-    if tp_no_optional is int:
-        return int(value)
-    if tp_no_optional is float:
-        return float(value)
-    if tp_no_optional is str:
-        return value
+    if tp is int:
+        return int
+    if tp is float:
+        return float
+    if tp is str:
+        return str
 
     # 2-3) Collections: CSV helper
     if origin in (list, tuple, set):
-        args = list(get_args(tp_no_optional))
+        args = list(get_args(tp))
         # Fixed-length tuple: e.g., tuple[int, int, str]
-        parts = [p.strip() for p in value.split(",") if p.strip() != ""]
         if origin is tuple and args and len(args) > 1:
-            # Map by position; if lengths differ, use last type for remaining
-            casted = [
-                _cast(parts[i], args[i] if i < len(args) else args[-1])
-                for i in range(len(parts))
-            ]
-            return tuple(casted)
+            item_casters = [_make_item_caster(a) for a in args]
+
+            def parse_fixed_tuple(value: str) -> object:
+                parts = _split_csv(value)
+                # Map by position; if lengths differ, use last type for remaining
+                return tuple(
+                    item_casters[i if i < len(item_casters) else -1](p)
+                    for i, p in enumerate(parts)
+                )
+
+            return parse_fixed_tuple
+
         # Single-arg generics (list[T], tuple[T], set[T])
-        inner: type = args[0] if args else str
-        return origin([_cast(p, inner) for p in parts])  # pyright: ignore[reportUnknownVariableType]
+        inner_cast = _make_item_caster(args[0] if args else str)
+
+        def parse_csv(value: str) -> object:
+            return origin([inner_cast(p) for p in _split_csv(value)])  # pyright: ignore[reportUnknownVariableType, reportOptionalCall]
+
+        return parse_csv
 
     # 2-4) dict[str, T]: support "k=v,k=v"
     if origin is dict:
-        k_t, v_t = get_args(tp_no_optional) or (str, str)
+        k_t, v_t = get_args(tp) or (str, str)
+        key_cast, value_cast = _make_item_caster(k_t), _make_item_caster(v_t)
 
-        def parse_pair(p: str) -> tuple[object, object]:
-            k, v = p.split("=", 1)
-            return _cast(k.strip(), k_t), _cast(v.strip(), v_t)
+        def parse_kv(value: str) -> object:
+            parsed: dict[object, object] = {}
+            for p in value.split(","):
+                k, sep, v = p.partition("=")
+                if sep:
+                    parsed[key_cast(k.strip())] = value_cast(v.strip())
+            return parsed
 
-        pairs = [parse_pair(p) for p in value.split(",") if "=" in p]
-        return {k: v for k, v in pairs}
+        return parse_kv
 
     # 3) Last resort: let TypeAdapter validate (Enum/Path, etc.)
-    try:
-        return _try_typeadapter_python(value, tp_no_optional)  # pyright: ignore[reportUnknownVariableType]
-    except Exception:
-        # If it still fails, return raw string; Pydantic will raise on validation
-        return value
+    from_python = _python_validator(tp)
+
+    def parse_python(value: str) -> object:
+        try:
+            return from_python(value)
+        except Exception:
+            # If it still fails, return raw string; Pydantic will raise on validation
+            return value
+
+    return parse_python
+
+
+def _make_item_caster(tp: type) -> Callable[[str], object]:
+    """
+    Build a caster for one stripped CSV item (or k=v key/value). int/float/str
+    items are converted directly and only go through the full JSON-first caster
+    when that fails, which yields the same values without a TypeAdapter call per
+    item.
+    """
+    cast = _make_caster(tp)
+
+    if tp is int or tp is float:
+        convert: Callable[[str], object] = tp
+
+        def cast_number(item: str) -> object:
+            try:
+                return convert(item)
+            except ValueError:
+                return cast(item)
+
+        return cast_number
+
+    if tp is str:
+
+        def cast_str(item: str) -> object:
+            # Only a quoted JSON string can decode to something other than itself
+            return cast(item) if item.startswith('"') else item
+
+        return cast_str
+
+    return cast
+
+
+def _split_csv(value: str) -> list[str]:
+    return [p for p in (p.strip() for p in value.split(",")) if p != ""]
 
 
 def _get_env_var_name(cls: Type[EnvModel], field_name: str, finfo: Any) -> str:
@@ -2,6 +2,7 @@ import os
 import unittest
 from pathlib import Path
 from typing import Literal, Optional
+from unittest import mock
 
 from pydantic import BaseModel, Field
 
@@ -66,6 +67,9 @@ class TestEnvModel(unittest.TestCase):
         assert cfg.db.host == "db.local" and cfg.db.port == 15432
         assert str(cfg.log_path) == str(Path("/var/log/app.log"))
         assert cfg.server_host == "10.0.0.1"
+        # Only env-provided fields count as explicitly set; defaults do not
+        assert "port" in cfg.model_fields_set
+        assert "host" not in cfg.model_fields_set
 
         # overrides take precedence over env
         print("\n--- override precedence (port=9000) ---")
@@ -75,6 +79,112 @@ class TestEnvModel(unittest.TestCase):
 
         print("\n[OK] ALL TESTS PASSED")
 
+    def test_bool_values(self) -> None:
+        class BoolConfig(EnvModel):
+            __env_prefix__ = "BOOL_"
+            flag: bool = False
+
+        cases = {
+            "true": True,
+            "1": True,
+            "on": True,
+            " Yes ": True,
+            "T": True,
+            "false": False,
+            "0": False,
+            "OFF": False,
+            "n": False,
+        }
+        for raw, expected in cases.items():
+            os.environ["BOOL_FLAG"] = raw
+            assert BoolConfig.from_env().flag is expected, raw
+
+        print("\n[OK] Bool values test passed")
+
+    def test_skip_validation(self) -> None:
+        class FastConfig(EnvModel):
+            __env_prefix__ = "FAST_"
+            __env_skip_validation__ = True
+            port: int = 8080
+            debug: bool = False
+            size: tuple[int, int] = (640, 480)
+            name: str = "fast"
+
+        os.environ["FAST_PORT"] = "5000"
+        os.environ["FAST_DEBUG"] = "yes"
+        os.environ["FAST_SIZE"] = "800,600"
+
+        cfg = FastConfig.from_env(name="override")
+        assert cfg.port == 5000
+        assert cfg.debug is True
+        assert cfg.size == (800, 600)
+        assert cfg.name == "override"
+        assert cfg.model_fields_set == {"port", "debug", "size", "name"}
+        assert FastConfig.from_env().model_fields_set == {"port", "debug", "size"}
+
+        print("\n[OK] Skip validation test passed")
+
+    def test_forward_ref_rebuild(self) -> None:
+        class Outer(EnvModel):
+            __env_prefix__ = "FR_"
+            db: Optional["FRDB"] = None
+
+        class FRDB(BaseModel):
+            host: str
+
+        Outer.model_rebuild()
+        os.environ["FR_DB"] = '{"host":"x"}'
+        cfg = Outer.from_env()
+        assert cfg.db == FRDB(host="x")
+
+        print("\n[OK] Forward ref rebuild test passed")
+
+    def test_nested_forward_ref_rebuild(self) -> None:
+        class Inner(BaseModel):
+            leaf: "Leaf"
+
+        class NestedOuter(EnvModel):
+            __env_prefix__ = "NFR_"
+            inner: Optional[Inner] = None
+
+        class Leaf(BaseModel):
+            value: int
+
+        Inner.model_rebuild()
+        NestedOuter.model_rebuild()
+        os.environ["NFR_INNER"] = '{"leaf":{"value":3}}'
+        cfg = NestedOuter.from_env()
+        assert cfg.inner is not None and cfg.inner.leaf == Leaf(value=3)
+
+        print("\n[OK] Nested forward ref rebuild test passed")
+
+    def test_patched_environ(self) -> None:
+        class MockConfig(EnvModel):
+            __env_prefix__ = "MK_"
+            port: int = 1
+
+        with mock.patch("os.environ", {"MK_PORT": "7"}):
+            assert MockConfig.from_env().port == 7
+        with mock.patch.dict(os.environ, {"MK_PORT": "8"}):
+            assert MockConfig.from_env().port == 8
+
+        print("\n[OK] Patched environ test passed")
+
+    def test_prefix_change(self) -> None:
+        class PrefixConfig(EnvModel):
+            __env_prefix__ = "OLD_"
+            port: int = 1
+
+        os.environ["OLD_PORT"] = "2"
+        os.environ["NEW_PORT"] = "3"
+        assert PrefixConfig.from_env().port == 2
+
+        PrefixConfig.__env_prefix__ = "NEW_"
+        assert PrefixConfig.from_env().port == 3
+        assert get_registered_models()[PrefixConfig]["port"] == "NEW_PORT"
+
+        print("\n[OK] Prefix change test passed")
+
     def test_registry_functions(self) -> None:
         """Test registry functions"""
 
@@ -116,6 +226,18 @@ class TestEnvModel(unittest.TestCase):
         assert (TestConfig2, "debug") in env_vars["TEST2_DEBUG"]
         assert (TestConfig2, "name") in env_vars["TEST2_NAME"]
 
+        # Models defined after a lookup show up in the next one
+        class TestConfig3(EnvModel):
+            __env_prefix__ = "TEST3_"
+            host: str = "localhost"
+
+        assert (TestConfig3, "host") in get_registered_envs()["TEST3_HOST"]
+        assert "TEST3_HOST" not in env_vars
+
+        # Removing a model from the registry removes its env vars
+        EnvModel.__env_registry__.discard(TestConfig3)
+        assert "TEST3_HOST" not in get_registered_envs()
+
         print("\n--- Registered Models ---")
         for model_cls, field_env_map in models.items():
             print(f"  {model_cls.__name__}:")